@@ -38,7 +38,6 @@ class SymphonyTextInfo(IA2TextTextInfo):
 	def _getFormatFieldFromLegacyAttributesString(  # noqa: C901
 			self,
 			attribsString: str,
-			offset: int
 	) -> textInfos.FormatField:
 
 		"""Get format field with information retrieved from a text
@@ -48,73 +47,53 @@ class SymphonyTextInfo(IA2TextTextInfo):
 		(used by LibreOffice >= 24.2).
 
 		:param attribsString: Legacy text attributes string.
-		:param offset: Character offset for which to retrieve the
-		 			   attributes.
 		:return: Format field containing the text attribute information.
 		"""
 		formatField=textInfos.FormatField()
 		if attribsString:
 			formatField.update(splitIA2Attribs(attribsString))
 
-		try:
-			escapement = int(formatField["CharEscapement"])
+		escapement = formatField.get("CharEscapement")
+		if escapement is not None:
+			escapement = int(escapement)
 			if escapement < 0:
 				formatField["text-position"] = TextPosition.SUBSCRIPT
 			elif escapement > 0:
 				formatField["text-position"] = TextPosition.SUPERSCRIPT
 			else:
 				formatField["text-position"] = TextPosition.BASELINE
-		except KeyError:
-			pass
-		try:
-			formatField["font-name"] = formatField["CharFontName"]
-		except KeyError:
-			pass
-		try:
+		fontName = formatField.get("CharFontName")
+		if fontName is not None:
+			formatField["font-name"] = fontName
+		fontSize = formatField.get("CharHeight")
+		if fontSize is not None:
 			# Translators: Abbreviation for points, a measurement of font size.
-			formatField["font-size"] = pgettext("font size", "%s pt") % formatField["CharHeight"]
-		except KeyError:
-			pass
-		try:
-			formatField["italic"] = formatField["CharPosture"] == "2"
-		except KeyError:
-			pass
-		try:
-			formatField["strikethrough"] = formatField["CharStrikeout"] == "1"
-		except KeyError:
-			pass
-		try:
-			underline = formatField["CharUnderline"]
+			formatField["font-size"] = pgettext("font size", "%s pt") % fontSize
+		posture = formatField.get("CharPosture")
+		if posture is not None:
+			formatField["italic"] = posture == "2"
+		strikeout = formatField.get("CharStrikeout")
+		if strikeout is not None:
+			formatField["strikethrough"] = strikeout == "1"
+		underline = formatField.get("CharUnderline")
+		if underline is not None:
 			if underline == "10":
 				# Symphony doesn't provide for semantic communication of spelling errors, so we have to rely on the WAVE underline type.
 				formatField["invalid-spelling"] = True
 			else:
 				formatField["underline"] = underline != "0"
-		except KeyError:
-			pass
-		try:
-			formatField["bold"] = float(formatField["CharWeight"]) > 100
-		except KeyError:
-			pass
-		try:
-			color=formatField.pop('CharColor')
-		except KeyError:
-			color=None
+		weight = formatField.get("CharWeight")
+		if weight is not None:
+			# Font weights are whole numbers (e.g. 100 for normal, 150 for bold),
+			# though they may be given with a fractional part.
+			formatField["bold"] = int(weight.split(".", 1)[0]) > 100
+		color = formatField.pop("CharColor", None)
 		if color:
-			formatField['color']=colors.RGB.fromString(color) 
-		try:
-			backgroundColor=formatField.pop('CharBackColor')
-		except KeyError:
-			backgroundColor=None
+			formatField['color']=colors.RGB.fromString(color)
+		backgroundColor = formatField.pop("CharBackColor", None)
 		if backgroundColor:
 			formatField['background-color']=colors.RGB.fromString(backgroundColor)
 
-		if offset == 0:
-			# Only include the list item prefix on the first line of the paragraph.
-			numbering = formatField.get("Numbering")
-			if numbering:
-				formatField["line-prefix"] = numbering.get("NumberingPrefix") or numbering.get("BulletChar")
-
 		return formatField
 
 	def _getFormatFieldAndOffsetsFromAttributes(
@@ -135,34 +114,102 @@ class SymphonyTextInfo(IA2TextTextInfo):
 				 and start and end offset of the attribute run.
 		"""
 		obj = self.obj
+		# optimisation: Adjacent offsets usually fall into the same attribute run,
+		# so reuse the format field of the last run fetched for this object.
+		cacheRuns = isinstance(obj, SymphonyText)
+		runCache = obj._attribsRunCache if cacheRuns else None
+		if runCache and runCache[0] <= offset < runCache[1]:
+			startOffset, endOffset, isLegacy, cachedFormatField = runCache
+			formatField = self._copyFormatField(cachedFormatField)
+			if isLegacy and not offset:
+				self._addListItemPrefix(formatField)
+			return formatField, (startOffset, endOffset)
+
+		ia2TextObj = obj.IAccessibleTextObject
 		try:
-			startOffset, endOffset, attribsString = obj.IAccessibleTextObject.attributes(offset)
+			startOffset, endOffset, attribsString = ia2TextObj.attributes(offset)
 		except COMError:
 			log.debugWarning("could not get attributes", exc_info=True)
-			return textInfos.FormatField(), (self._startOffset, self._endOffset)
+			formatField = textInfos.FormatField()
+			self._addLink(formatField, offset)
+			return formatField, (self._startOffset, self._endOffset)
 
-		if not attribsString and offset > 0:
-			try:
-				attribsString = obj.IAccessibleTextObject.attributes(offset - 1)[2]
-			except COMError:
-				pass
+		if attribsString:
+			if cacheRuns:
+				obj._lastNonEmptyAttribs = (startOffset, endOffset, attribsString)
+		elif offset > 0:
+			lastAttribs = obj._lastNonEmptyAttribs if cacheRuns else None
+			if lastAttribs and lastAttribs[0] <= offset - 1 < lastAttribs[1]:
+				# optimisation: The previous offset is in the last non-empty run we fetched.
+				attribsString = lastAttribs[2]
+			else:
+				try:
+					prevStartOffset, prevEndOffset, attribsString = ia2TextObj.attributes(offset - 1)
+				except COMError:
+					pass
+				else:
+					if cacheRuns and attribsString:
+						obj._lastNonEmptyAttribs = (prevStartOffset, prevEndOffset, attribsString)
 
 		# LibreOffice >= 24.2 uses IAccessible2 text attributes, earlier versions use
 		# custom attributes, with the attributes string starting with "Version:1;"
-		if attribsString and attribsString.startswith('Version:1;'):
-			formatField = self._getFormatFieldFromLegacyAttributesString(
-				attribsString,
-				offset
-			)
+		isLegacy = bool(attribsString) and attribsString.startswith('Version:1;')
+		if isLegacy:
+			formatField = self._getFormatFieldFromLegacyAttributesString(attribsString)
 		else:
-			formatField, (startOffset, endOffset) = super()._getFormatFieldAndOffsets(
+			formatField, runOffsets = super()._getFormatFieldAndOffsets(
 				offset,
 				formatConfig,
 				calculateOffsets
 			)
-
+			# If fetching the attributes fails, the base implementation falls back to this TextInfo's own range,
+			# which is not an attribute run and thus must not be cached.
+			cacheRuns = cacheRuns and runOffsets == (startOffset, endOffset)
+			startOffset, endOffset = runOffsets
+
+		# optimisation: Assume a hyperlink occupies a full attribute run,
+		# so it can be cached along with the rest of the run.
+		self._addLink(formatField, offset)
+
+		if cacheRuns:
+			obj._attribsRunCache = (startOffset, endOffset, isLegacy, self._copyFormatField(formatField))
+		if isLegacy and not offset:
+			# Only include the list item prefix on the first line of the paragraph.
+			self._addListItemPrefix(formatField)
 		return formatField, (startOffset, endOffset)
 
+	@staticmethod
+	def _copyFormatField(formatField: textInfos.FormatField) -> textInfos.FormatField:
+		"""Copy a format field, including nested subattribute dictionaries such as Numbering,
+		so that the format field cached for an attribute run is never shared with callers.
+		"""
+		return textInfos.FormatField({
+			key: dict(value) if isinstance(value, dict) else value
+			for key, value in formatField.items()
+		})
+
+	def _addLink(self, formatField: textInfos.FormatField, offset: int) -> None:
+		"""Mark the given format field as a link if the offset is within a hyperlink."""
+		hypertext = self.obj._IA2Hypertext
+		if not hypertext:
+			return
+		try:
+			if hypertext.hyperlinkIndex(offset) != -1:
+				formatField["link"] = True
+		except COMError:
+			pass
+
+	@staticmethod
+	def _addListItemPrefix(formatField: textInfos.FormatField) -> None:
+		"""Add the list item prefix to the given format field for the start of a paragraph.
+		This is kept out of the format field cached for the attribute run,
+		as it only applies at offset 0 of the paragraph,
+		whereas the attribute run usually starts at another offset or spans further offsets.
+		"""
+		numbering = formatField.get("Numbering")
+		if numbering:
+			formatField["line-prefix"] = numbering.get("NumberingPrefix") or numbering.get("BulletChar")
+
 	def _getFormatFieldAndOffsets(
 			self,
 			offset: int,
@@ -176,37 +223,27 @@ class SymphonyTextInfo(IA2TextTextInfo):
 		)
 		obj = self.obj
 
-		# optimisation: Assume a hyperlink occupies a full attribute run.
-		try:
-			if obj.IAccessibleTextObject.QueryInterface(
-				IA2.IAccessibleHypertext
-			).hyperlinkIndex(offset) != -1:
-				formatField["link"] = True
-		except COMError:
-			pass
-
-		if obj.hasFocus:
+		reportPage = formatConfig["reportPage"]
+		reportLineNumber = formatConfig["reportLineNumber"]
+		# optimisation: Only fetch the document attributes if they are going to be reported.
+		if (reportPage or reportLineNumber) and obj.hasFocus:
 			# Symphony exposes some information for the caret position as attributes on the document object.
 			# optimisation: Use the tree interceptor to get the document.
-			try:
-				docAttribs = obj.treeInterceptor.rootNVDAObject.IA2Attributes
-			except AttributeError:
-				# No tree interceptor, so we can't efficiently fetch this info.
-				pass
-			else:
-				try:
-					formatField["page-number"] = docAttribs["page-number"]
-				except KeyError:
-					pass
-				try:
-					formatField["line-number"] = docAttribs["line-number"]
-				except KeyError:
-					pass
+			# Without a tree interceptor, we can't efficiently fetch this info.
+			treeInterceptor = obj.treeInterceptor
+			docAttribs = treeInterceptor and getattr(treeInterceptor.rootNVDAObject, "IA2Attributes", None)
+			if docAttribs:
+				pageNumber = docAttribs.get("page-number") if reportPage else None
+				if pageNumber is not None:
+					formatField["page-number"] = pageNumber
+				lineNumber = docAttribs.get("line-number") if reportLineNumber else None
+				if lineNumber is not None:
+					formatField["line-number"] = lineNumber
 
 		return formatField, (startOffset, endOffset)
 
 	def _getLineOffsets(self, offset):
-		start, end = super(SymphonyTextInfo, self)._getLineOffsets(offset)
+		start, end = super()._getLineOffsets(offset)
 		if offset == 0 and start == 0 and end == 0:
 			# HACK: Symphony doesn't expose any characters at all on empty lines, but this means we don't ever fetch the list item prefix in this case.
 			# Fake a character so that the list item prefix will be spoken on empty lines.
@@ -215,26 +252,63 @@ class SymphonyTextInfo(IA2TextTextInfo):
 
 	def _getStoryLength(self):
 		# HACK: Account for the character faked in _getLineOffsets() so that move() will work.
-		return max(super(SymphonyTextInfo, self)._getStoryLength(), 1)
+		return max(super()._getStoryLength(), 1)
+
+
+class SymphonyHypertextObject(IAccessible):
+	"""Base class for LibreOffice objects whose text is exposed using L{SymphonyTextInfo}."""
 
+	#: Type definition for auto prop '_get__IA2Hypertext'
+	_IA2Hypertext: Optional[IA2.IAccessibleHypertext]
 
-class SymphonyText(IAccessible, EditableText):
+	def _get__IA2Hypertext(self) -> Optional[IA2.IAccessibleHypertext]:
+		# Permanently cache the result.
+		try:
+			self._IA2Hypertext = self.IAccessibleTextObject.QueryInterface(IA2.IAccessibleHypertext)
+		except COMError:
+			self._IA2Hypertext = None
+		return self._IA2Hypertext
+
+
+class SymphonyText(SymphonyHypertextObject, EditableText):
 	TextInfo = SymphonyTextInfo
 
+	#: The last attribute run fetched by L{SymphonyTextInfo},
+	#: as a tuple of start offset, end offset,
+	#: whether the run uses legacy attributes and format field.
+	#: Like cached properties, this is only valid for one core pump cycle.
+	_attribsRunCache: Optional[tuple[int, int, bool, textInfos.FormatField]] = None
+	#: The last attribute run with a non-empty attributes string,
+	#: as a tuple of start offset, end offset and attributes string.
+	#: Used when an offset has no attributes of its own, see L{SymphonyTextInfo}.
+	_lastNonEmptyAttribs: Optional[tuple[int, int, str]] = None
+
+	def _invalidateAttribsRunCache(self) -> None:
+		self._attribsRunCache = None
+		self._lastNonEmptyAttribs = None
+
+	def invalidateCache(self):
+		self._invalidateAttribsRunCache()
+		super().invalidateCache()
+
+	def event_caret(self):
+		self._invalidateAttribsRunCache()
+		super().event_caret()
+
 	def _get_positionInfo(self):
 		level = self.IA2Attributes.get("heading-level")
 		if level:
 			return {"level": int(level)}
-		return super(SymphonyText, self).positionInfo
+		return super().positionInfo
 
 
-class SymphonyTableCell(IAccessible):
+class SymphonyTableCell(SymphonyHypertextObject):
 	"""Silences particular states, and redundant column/row numbers"""
 
 	TextInfo=SymphonyTextInfo
 
 	def _get_cellCoordsText(self):
-		return super(SymphonyTableCell,self).name
+		return super().name
 
 	name=None
 
@@ -245,7 +319,7 @@ class SymphonyTableCell(IAccessible):
 		)
 
 	def _get_states(self):
-		states=super(SymphonyTableCell,self).states
+		states=super().states
 		states.discard(controlTypes.State.MULTILINE)
 		states.discard(controlTypes.State.EDITABLE)
 		if controlTypes.State.SELECTED not in states and controlTypes.State.FOCUSED in states:
@@ -272,14 +346,30 @@ class SymphonyIATableCell(SymphonyTableCell):
 		if (
 			self.table
 			and self.table == curFocus.table
-			and self.table.IAccessibleTable2Object.nSelectedCells > 0
+			and self.table.selectedCellCount > 0
 		):
 			curFocus.announceSelectionChange()
 
 	def event_selectionRemove(self):
 		self.event_selectionAdd()
 
+	#: The number of selected cells when a selection change was last announced for this cell.
+	#: Like cached properties, this is only valid for one core pump cycle.
+	_lastAnnouncedSelectedCellCount: Optional[int] = None
+
+	def invalidateCache(self):
+		self._lastAnnouncedSelectedCellCount = None
+		super().invalidateCache()
+
 	def announceSelectionChange(self):
+		# LibreOffice fires an event for every cell added to or removed from the selection.
+		# optimisation: Only announce once per core cycle for a given selected cell count.
+		# Within a core cycle, selectedCellCount, states and cellCoordsText are cached,
+		# so announcing again would report exactly the same information.
+		selectedCellCount = self.table.selectedCellCount
+		if selectedCellCount == self._lastAnnouncedSelectedCellCount:
+			return
+		self._lastAnnouncedSelectedCellCount = selectedCellCount
 		if self is api.getFocusObject():
 			speech.speakObjectProperties(
 				self,
@@ -292,19 +382,25 @@ class SymphonyIATableCell(SymphonyTableCell):
 
 	def _get_cellCoordsText(self):
 		if self.hasSelection and controlTypes.State.FOCUSED in self.states:
-			count = self.table.IAccessibleTable2Object.nSelectedCells
+			count = self.table.selectedCellCount
+			# Only the first and last selected cells are needed.
+			# Walking the accSelection enumerator fetches just those two,
+			# whereas IAccessibleTable2::selectedCells would marshal every selected cell,
+			# and selectedRows/selectedColumns only cover fully selected rows and columns.
 			selection = self.table.IAccessibleObject.accSelection
 			enumObj = selection.QueryInterface(oleacc.IEnumVARIANT)
 			firstChild: Union[int, comtypes.client.dynamic._Dispatch]
 			firstChild, _retrievedCount = enumObj.Next(1)
-			# skip over all except the last element
-			enumObj.Skip(count - 2)
+			if count > 2:
+				# skip over all except the last element
+				enumObj.Skip(count - 2)
 			lastChild: Union[int, comtypes.client.dynamic._Dispatch]
 			lastChild, _retrieveCount = enumObj.Next(1)
 			# in LibreOffice 7.3.0, the IEnumVARIANT returns a child ID,
 			# in LibreOffice >= 7.4, it returns an IDispatch
 			if isinstance(firstChild, int):
-				tableAccessible = self.table.IAccessibleTable2Object.QueryInterface(IA2.IAccessible2)
+				# The table's IAccessibleObject already is an IAccessible2, so no need to query for it.
+				tableAccessible = self.table.IAccessibleObject
 				firstAccessible = tableAccessible.accChild(firstChild).QueryInterface(IA2.IAccessible2)
 				lastAccessible = tableAccessible.accChild(lastChild).QueryInterface(IA2.IAccessible2)
 			elif isinstance(firstChild, comtypes.client.dynamic._Dispatch):
@@ -341,6 +437,27 @@ class SymphonyIATableCell(SymphonyTableCell):
 
 class SymphonyTable(IAccessible):
 
+	#: Type definition for auto prop '_get_selectedCellCount'
+	selectedCellCount: int
+
+	def _get_selectedCellCount(self) -> int:
+		"""The number of selected cells, as reported by IAccessibleTable2::nSelectedCells.
+		As this is cached for the duration of a core cycle,
+		handling a selection change only fetches it once,
+		even though it is needed for the event, the selected state and the cell coordinates.
+		"""
+		return self.IAccessibleTable2Object.nSelectedCells
+
+	def getSelectedItemsCount(self, maxCount=2):
+		# optimisation: IAccessibleTable2::nSelectedCells is a single call,
+		# whereas counting using accSelection requires several calls on the returned enumerator.
+		if hasattr(self, 'IAccessibleTable2Object'):
+			try:
+				return self.selectedCellCount
+			except COMError as e:
+				log.debug(f"Error calling IAccessibleTable2::nSelectedCells, {e}")
+		return super().getSelectedItemsCount(maxCount)
+
 	def event_selectionWithIn(self):
 		curFocus = api.getFocusObject()
 		if self == curFocus.table:
@@ -382,7 +499,7 @@ class SymphonyDocumentTextInfo(TreeCompoundTextInfo):
 				"cursor positioned {horizontalDistance} from left edge of page, {verticalDistance} from top edge of page"
 			).format(horizontalDistance=horizontalDistanceText, verticalDistance=verticalDistanceText)
 		except (AttributeError, KeyError):
-			return super(SymphonyDocumentTextInfo, self)._get_locationText()
+			return super()._get_locationText()
 
 
 class SymphonyDocument(CompoundDocument):
@@ -423,30 +540,50 @@ class SymphonyDocument(CompoundDocument):
 			log.warning('Backspace did not remove text as expected.')
 
 
+#: Window classes of LibreOffice windows containing accessible objects.
+_SAL_WINDOW_CLASSES = frozenset(("SALTMPSUBFRAME", "SALSUBFRAME", "SALFRAME"))
+#: Window classes of LibreOffice windows which may contain a word processor document.
+_SAL_DOCUMENT_WINDOW_CLASSES = frozenset(("SALTMPSUBFRAME", "SALFRAME"))
+#: Roles of LibreOffice objects which may be a word processor document.
+_SAL_DOCUMENT_ROLES = frozenset((controlTypes.Role.DOCUMENT, controlTypes.Role.TEXTFRAME))
+#: Roles of objects whose children are searched for the status bar.
+_STATUS_BAR_CONTAINER_ROLES = frozenset((
+	controlTypes.Role.DIALOG,
+	controlTypes.Role.FRAME,
+	controlTypes.Role.OPTIONPANE,
+	controlTypes.Role.ROOTPANE,
+	controlTypes.Role.WINDOW,
+))
+
+
 class AppModule(appModuleHandler.AppModule):
 
 	def chooseNVDAObjectOverlayClasses(self, obj, clsList):
-		role=obj.role
-		windowClassName=obj.windowClassName
-		if isinstance(obj, IAccessible) and windowClassName in ("SALTMPSUBFRAME", "SALSUBFRAME", "SALFRAME"):
-			if role == controlTypes.Role.TABLECELL:
-				if obj._IATableCell:
-					clsList.insert(0, SymphonyIATableCell)
-				else:
-					clsList.insert(0, SymphonyTableCell)
-			elif role == controlTypes.Role.TABLE and (
-				hasattr(obj, "IAccessibleTable2Object")
-				or hasattr(obj, "IAccessibleTableObject")
-			):
-				clsList.insert(0, SymphonyTable)
-			elif hasattr(obj, "IAccessibleTextObject"):
-				clsList.insert(0, SymphonyText)
-			if role == controlTypes.Role.PARAGRAPH:
-				clsList.insert(0, SymphonyParagraph)
+		if not isinstance(obj, IAccessible) or obj.windowClassName not in _SAL_WINDOW_CLASSES:
+			return
+		role = obj.role
+		if role == controlTypes.Role.TABLECELL:
+			if obj._IATableCell:
+				clsList.insert(0, SymphonyIATableCell)
+			else:
+				clsList.insert(0, SymphonyTableCell)
+		elif role == controlTypes.Role.TABLE and (
+			hasattr(obj, "IAccessibleTable2Object")
+			or hasattr(obj, "IAccessibleTableObject")
+		):
+			clsList.insert(0, SymphonyTable)
+		elif hasattr(obj, "IAccessibleTextObject"):
+			clsList.insert(0, SymphonyText)
+		if role == controlTypes.Role.PARAGRAPH:
+			clsList.insert(0, SymphonyParagraph)
 
 	def event_NVDAObject_init(self, obj):
 		windowClass = obj.windowClassName
-		if windowClass in ("SALTMPSUBFRAME", "SALFRAME") and obj.role in (controlTypes.Role.DOCUMENT,controlTypes.Role.TEXTFRAME) and obj.description:
+		if (
+			windowClass in _SAL_DOCUMENT_WINDOW_CLASSES
+			and obj.role in _SAL_DOCUMENT_ROLES
+			and obj.description
+		):
 			# This is a word processor document.
 			obj.description = None
 			obj.treeInterceptorClass = SymphonyDocument
@@ -457,13 +594,7 @@ class AppModule(appModuleHandler.AppModule):
 		(up to the given depth) has the corresponding role."""
 		if obj.role == controlTypes.Role.STATUSBAR:
 			return obj
-		if max_depth < 1 or obj.role not in {
-			controlTypes.Role.DIALOG,
-			controlTypes.Role.FRAME,
-			controlTypes.Role.OPTIONPANE,
-			controlTypes.Role.ROOTPANE,
-			controlTypes.Role.WINDOW
-		}:
+		if max_depth < 1 or obj.role not in _STATUS_BAR_CONTAINER_ROLES:
 			return None
 		for child in obj.children:
 			status_bar = self.searchStatusBar(child, max_depth - 1)